@@ -128,6 +128,7 @@ class BaseBackend(CodeGen):
         if ops:
             self._funcs.update(ops)
         self._helper_funcs = []
+        self._func_defs = {}
 
         # definition of extrinsic function _imports
         self._imports = ["from numpy import pi, sqrt"]
@@ -194,6 +195,11 @@ class BaseBackend(CodeGen):
             # extract the provided callable
             func = func_info['func']
 
+        elif (func_name, func_info['def']) in self._func_defs:
+
+            # re-use the callable that has been created from the function definition before
+            func = self._func_defs[(func_name, func_info['def'])]
+
         else:
 
             # extract the provided function definition
@@ -209,6 +215,7 @@ class BaseBackend(CodeGen):
             # evaluate the function string to receive a callable
             exec(func_str, globals())
             func = globals().pop(func_name)
+            self._func_defs[(func_name, func_str)] = func
 
         return {'func': func, 'call': func_name}
 
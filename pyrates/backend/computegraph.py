@@ -31,7 +31,7 @@
 
 # external _imports
 from typing import Any, Callable, Union, Iterable, Optional
-from networkx import MultiDiGraph
+from networkx import MultiDiGraph, ancestors
 from sympy import Symbol, Expr, Function
 import numpy as np
 
@@ -60,7 +60,7 @@ class ComputeNode:
         Shape of the variable.
     """
 
-    __slots__ = ["name", "symbol", "dtype", "shape", "_value"]
+    __slots__ = ["name", "symbol", "dtype", "shape", "_value", "_hash"]
 
     def __init__(self, name: str, symbol: Union[Symbol, Expr, Function], dtype: Optional[str] = None,
                  shape: Optional[tuple] = None, def_shape: Optional[tuple] = None):
@@ -68,6 +68,7 @@ class ComputeNode:
         """
 
         self.name = name
+        self._hash = hash(name)
         self.symbol = symbol
         self.shape = self._get_shape(shape, def_shape)
         self._value = np.zeros(self.shape)
@@ -108,10 +109,14 @@ class ComputeNode:
         return "complex" in self.dtype
 
     def _is_equal_to(self, v):
+        if getattr(v, "_hash", None) != self._hash:
+            return False
         for attr in self.__slots__:
+            if attr == "_value":
+                continue
             if not hasattr(v, attr) or getattr(v, attr) != getattr(self, attr):
                 return False
-        return True
+        return np.array_equal(v.value, self.value)
 
     def _get_value(self, value: Optional[Union[list, np.ndarray]] = None, dtype: Optional[str] = None,
                    shape: Optional[tuple] = None):
@@ -126,7 +131,7 @@ class ComputeNode:
         if not hasattr(value, 'shape'):
             if type(value) is list:
                 return self._get_value(value=np.asarray(value, dtype=dtype), dtype=dtype, shape=shape)
-            return np.zeros(shape=shape, dtype=dtype) + value
+            return np.full(shape if shape is not None else (), value, dtype=dtype)
 
         # case III: match given shape with the shape of the given value array
         if shape is not None:
@@ -135,8 +140,8 @@ class ComputeNode:
                 return value
             if sum(shape) < sum(value.shape):
                 return value.squeeze()
-            idx = ",".join("None" if s == 1 else ":" for s in shape)
-            return eval(f'value[{idx}]')
+            idx = tuple(np.newaxis if s == 1 else slice(None) for s in shape)
+            return value[idx]
 
         # case IV: just ensure the correct data type of the value array
         return np.asarray(value, dtype=dtype)
@@ -160,15 +165,17 @@ class ComputeNode:
         return s
 
     def __deepcopy__(self, memodict: dict):
-        node = ComputeNode(name=self.name, symbol=self.symbol, dtype=self.dtype, shape=self.shape)
-        node._value = np.zeros_like(node._value) + node._value
+        node = self.__class__.__new__(self.__class__)
+        for attr in self.__slots__:
+            setattr(node, attr, getattr(self, attr))
+        node._value = self._value.copy()
         return node
 
     def __str__(self):
         return self.name
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
 
 
 class ComputeVar(ComputeNode):
@@ -249,6 +256,7 @@ class ComputeGraph(MultiDiGraph):
         self._state_var_indices = dict()
         self._state_var_hist = dict()
         self._node_names = {}
+        self._expr_cache = {}
 
     @property
     def state_vars(self):
@@ -302,49 +310,47 @@ class ComputeGraph(MultiDiGraph):
 
     def eval_nodes(self, nodes: Iterable):
 
-        return [self.eval_node(n) for n in nodes]
+        # node values are shared between all evaluations, such that common inputs are only evaluated once
+        values = {}
+        return [self._eval_node(n, values) for n in nodes]
 
     def eval_node(self, n):
 
-        inputs = tuple([self.eval_node(inp) for inp in self.predecessors(n)])
-        node = self.get_var(n)
-        if isinstance(node, ComputeOp):
-            return node.func(*inputs)
-        return node.value
+        return self._eval_node(n, dict())
 
     def eval_subgraph(self, n):
 
-        inputs = []
-        input_nodes = [node for node in self.predecessors(n)]
-        for inp in input_nodes:
-            inputs.append(self.eval_subgraph(inp))
-            self.remove_node(inp)
+        # evaluate node and all of its inputs
+        values = {}
+        value = self._eval_node(n, values, set_values=True)
+        values.pop(n)
 
-        node = self.get_var(n)
-        if inputs:
-            node.set_value(node.func(*tuple(inputs)))
+        # remove the inputs of the evaluated node from the graph
+        self.remove_nodes_from(list(values))
 
-        return node.value
+        return value
 
     def remove_subgraph(self, n):
 
-        for inp in self.predecessors(n):
-            self.remove_subgraph(inp)
-        self.remove_node(n)
+        self.remove_nodes_from(list(ancestors(self, n)) + [n])
 
     def compile(self):
 
+        # graph structure is going to change, so previously generated expressions may be outdated
+        self._expr_cache.clear()
+
         # evaluate constant-based operations
+        eq_nodes = set(self._eq_nodes)
         out_nodes = [node for node, out_degree in self.out_degree if out_degree == 0]
         for node in out_nodes:
 
             # process inputs of node
-            for inp in self.predecessors(node):
-                if self.get_var(inp).is_constant:
+            for inp in list(self.predecessors(node)):
+                if inp in self and self.get_var(inp).is_constant:
                     self.eval_subgraph(inp)
 
             # evaluate node if all its inputs are constants
-            if all([self.get_var(inp).is_constant for inp in self.predecessors(node)]) and node not in self._eq_nodes:
+            if node not in eq_nodes and all(self.get_var(inp).is_constant for inp in self.predecessors(node)):
                 self.eval_subgraph(node)
 
         # remove unconnected nodes and constants from graph
@@ -369,19 +375,21 @@ class ComputeGraph(MultiDiGraph):
             variables.append(lhs.value)
 
             # store information of the original, non-vectorized state variable
-            vshape = sum(lhs.shape)
-            if vshape >= 1:
-                self._state_var_indices[var] = (idx, idx+vshape)
-                idx += vshape
+            if lhs.shape:
+                vsize = int(np.prod(lhs.shape))
+                self._state_var_indices[var] = (idx, idx+vsize)
             else:
+                vsize = 1
                 self._state_var_indices[var] = idx
-                idx += 1
+            idx += vsize
 
         # add collected state variables to the backend
-        try:
-            state_vec = np.concatenate(variables, axis=0)
-        except ValueError:
-            state_vec = np.asarray(variables)
+        state_vec = np.empty((idx,), dtype=np.result_type(*variables) if variables else float)
+        idx = 0
+        for v in variables:
+            v = np.ravel(v)
+            state_vec[idx:idx+v.size] = v
+            idx += v.size
         dtype = 'complex' if 'complex' in state_vec.dtype.name else 'float'
         state_var_key, y = self.add_var(label='y', vtype='state_var', value=state_vec, dtype=dtype)
         rhs_var_key = self._generate_vecfield_var(state_vec, dtype)
@@ -495,6 +503,7 @@ class ComputeGraph(MultiDiGraph):
         self.var_updates.clear()
         self._state_var_indices.clear()
         self._eq_nodes.clear()
+        self._expr_cache.clear()
 
         # clear code generator
         self.backend.clear()
@@ -556,8 +565,12 @@ class ComputeGraph(MultiDiGraph):
             # collect expression and variables of right-hand side of equation
             expr_args, expr = self._node_to_expr(update)
             func_args.extend(expr_args)
-            expr_str, expr_args, _, _ = self._expr_to_str(expr, apply=True)
-            func_args.extend(expr_args)
+            if expr.is_Number:
+                # purely numeric right-hand sides do not require any further processing
+                expr_str = str(expr)
+            else:
+                expr_str, expr_args, _, _ = self._expr_to_str(expr, apply=True)
+                func_args.extend(expr_args)
             expressions.append(expr_str)
 
             # process left-hand side of equation
@@ -627,7 +640,12 @@ class ComputeGraph(MultiDiGraph):
     def _generate_func_tail(self, code_gen, vecfield_key: str):
         code_gen.generate_func_tail(rhs_var=vecfield_key)
 
-    def _node_to_expr(self, n: str, **kwargs) -> tuple:
+    def _node_to_expr(self, n: str) -> tuple:
+
+        # re-use expressions of nodes that have been visited before (sub-graphs may be shared by multiple equations)
+        if n in self._expr_cache:
+            expr_args, expr = self._expr_cache[n]
+            return list(expr_args), expr
 
         expr_args = []
         node = self.get_var(n)
@@ -636,7 +654,7 @@ class ComputeGraph(MultiDiGraph):
         try:
 
             # process node inputs
-            expr_info = {self.get_var(inp).symbol: self._node_to_expr(inp, **kwargs) for inp in self.predecessors(n)}
+            expr_info = {self.get_var(inp).symbol: self._node_to_expr(inp) for inp in self.predecessors(n)}
 
             # replace old inputs with its processed versions
             expr = node.expr
@@ -665,8 +683,37 @@ class ComputeGraph(MultiDiGraph):
             else:
                 expr = node.symbol
 
+        self._expr_cache[n] = (tuple(expr_args), expr)
         return expr_args, expr
 
+    def _eval_node(self, n: str, values: dict, set_values: bool = False):
+
+        # iterative, depth-first evaluation of the node inputs (each input is evaluated only once)
+        stack = [n]
+        while stack:
+            node = stack[-1]
+            if node in values:
+                stack.pop()
+                continue
+            inputs = [inp for inp in self.predecessors(node) if inp not in values]
+            if inputs:
+                stack.extend(inputs)
+                continue
+            stack.pop()
+            v = self.get_var(node)
+            if set_values:
+                # store the evaluated values on the nodes
+                args = tuple(values[inp] for inp in self.predecessors(node))
+                if args:
+                    v.set_value(v.func(*args))
+                values[node] = v.value
+            elif isinstance(v, ComputeOp):
+                values[node] = v.func(*tuple(values[inp] for inp in self.predecessors(node)))
+            else:
+                values[node] = v.value
+
+        return values[n]
+
     def _expr_to_str(self, expr: Any, expr_str: str = None, apply: bool = True, **kwargs) -> tuple:
 
         # preparations
@@ -785,6 +832,10 @@ class ComputeGraph(MultiDiGraph):
                 node_names.append(list(self._get_inputs(node))[-1])
             node_keys.append(node)
 
+        # step 2: collect the input variables of each update once (they do not change while sorting)
+        update_inputs = {update: self._get_inputs(update) for update in nodes.values()}
+
+        # step 3: sort the equations such that each equation only depends on previously evaluated ones
         keys, values, defined_vars, undefined_vars = [], [], [], []
         n_nodes = len(nodes)
         while nodes:
@@ -793,7 +844,7 @@ class ComputeGraph(MultiDiGraph):
 
                 # go through node inputs and check whether it depends on other equations to be evaluated first
                 dependent, inp = False, ""
-                for inp in self._get_inputs(update):
+                for inp in update_inputs[update]:
                     if inp in node_names:
                         idx = node_names.index(inp)
                         if node_keys[idx] != node:
@@ -877,14 +928,16 @@ class ComputeGraph(MultiDiGraph):
 
     def _prune(self):
 
+        eq_nodes = set(self._eq_nodes)
+
         # remove all subgraphs that contain constants only
         for n in [node for node, out_degree in self.out_degree if out_degree == 0]:
-            if self.get_var(n).is_constant and n not in self._eq_nodes:
+            if n not in eq_nodes and self.get_var(n).is_constant:
                 self.remove_subgraph(n)
 
-        # remove all unconnected nodes
+        # remove all unconnected nodes (the out-degrees have to be re-evaluated after the removals above)
         for n in [node for node, out_degree in self.out_degree if out_degree == 0]:
-            if self.in_degree(n) == 0 and n not in self._eq_nodes:
+            if n not in eq_nodes and self.in_degree(n) == 0:
                 self.remove_node(n)
 
     def _generate_unique_label(self, label: str) -> str:
@@ -642,35 +642,39 @@ def replace(eq: str, term: str, replacement: str, rhs_only: tp.Optional[bool] =
     # replace every proper appearance of term in eq with replacement
     ################################################################
 
-    eq_new = ""
+    eq_parts = []
+    n = len(eq)
+    start = 0
     idx = eq.find(term)
 
     # go through all appearances of term in eq
     while idx != -1:
 
-        # get idx of sign that follows after term
+        # get idx of sign that follows after term and idx of sign that precedes term
         idx_follow_op = idx+len(term)
+        prev_op = eq[idx-1] if idx > start else eq[-1]
 
         # if it is an allowed sign, replace term, else not
         replaced = False
-        if ((idx_follow_op < len(eq) and eq[idx_follow_op] in allowed_follow_ops) and
-           (idx == 0 or eq[idx-1] in allowed_follow_ops)) or \
-                (idx_follow_op == len(eq) and eq[idx-1] in allowed_follow_ops):
-            eq_part = eq[:idx]
+        if ((idx_follow_op < n and eq[idx_follow_op] in allowed_follow_ops) and
+           (idx == start or prev_op in allowed_follow_ops)) or \
+                (idx_follow_op == n and prev_op in allowed_follow_ops):
+            eq_part = eq[start:idx]
             if (rhs_only and "=" in eq_part) or (lhs_only and "=" not in eq_part) or (not rhs_only and not lhs_only):
-                eq_new += f"{eq_part}{replacement}"
+                eq_parts.append(eq_part)
+                eq_parts.append(replacement)
                 replaced = True
         if not replaced:
-            eq_new += f"{eq[:idx_follow_op]}"
+            eq_parts.append(eq[start:idx_follow_op])
 
         # jump to next appearance of term in eq
-        eq = eq[idx_follow_op:]
-        idx = eq.find(term)
+        start = idx_follow_op
+        idx = eq.find(term, start)
 
     # add rest of eq to new eq
-    eq_new += eq
+    eq_parts.append(eq[start:])
 
-    return eq_new
+    return "".join(eq_parts)
 
 
 def is_diff_eq(eq: str) -> bool:
@@ -32,6 +32,9 @@
 __author__ = "Daniel Rose"
 __status__ = "Development"
 
+# cache for parsed YAML files (file path -> (modification time, file dictionary))
+file_cache = dict()
+
 
 def dict_from_yaml(path: str):
     """Load a template from YAML and return the resulting dictionary.
@@ -65,16 +68,13 @@ def dict_from_yaml(path: str):
         else:
             raise FileNotFoundError(f"Could not identify file with name {filename} in directory {directory}.")
 
-    # load as yaml file
-    from ruamel.yaml import YAML
-
-    yaml = YAML(typ="safe", pure=True)
-
-    with open(filepath, "r") as file:
-        file_dict = yaml.load(file)
+    # load as yaml file (each file is only parsed once, unless it has been modified since)
+    filepath = os.path.abspath(filepath)
+    file_dict = _load_yaml_file(filepath, mtime=os.path.getmtime(filepath))
 
     if template_name in file_dict:
-        template_dict = file_dict[template_name]
+        from copy import deepcopy
+        template_dict = deepcopy(file_dict[template_name])
         template_dict["path"] = path
         template_dict["name"] = template_name
     else:
@@ -83,6 +83,37 @@ def dict_from_yaml(path: str):
     return template_dict
 
 
+def _load_yaml_file(filepath: str, mtime: float) -> dict:
+    """Parse a YAML file into a dictionary, re-using the result of earlier calls for unmodified files.
+
+    Parameters
+    ----------
+    filepath
+        Absolute path to the YAML file. Used as key of the file cache.
+    mtime
+        Modification time of the file. A cached file dictionary is only re-used if it was parsed at the same
+        modification time.
+
+    Returns
+    -------
+    dict
+        Dictionary of all templates defined in the file. Shared between calls, so it must not be modified.
+    """
+
+    if filepath in file_cache and file_cache[filepath][0] == mtime:
+        return file_cache[filepath][1]
+
+    from ruamel.yaml import YAML
+
+    yaml = YAML(typ="safe", pure=True)
+
+    with open(filepath, "r") as file:
+        file_dict = yaml.load(file)
+
+    file_cache[filepath] = (mtime, file_dict)
+    return file_dict
+
+
 def dump_to_yaml(circuit, path: str, **kwargs) -> None:
     """Interface to dump a `CircuitTemplate` instance to YAML.
 
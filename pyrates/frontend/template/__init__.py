@@ -25,6 +25,8 @@
 # CITATION:
 # 
 # Richard Gast and Daniel Rose et. al. in preparation
+from sys import intern
+
 from ._io import _complete_template_path
 from .node import NodeTemplate
 from .operator import OperatorTemplate
@@ -68,6 +70,7 @@ def from_yaml(path):
         the filename without file extension and the last part refers to the template name.
     """
 
+    path = intern(path)
     if path in template_cache:
         # if we have loaded this template in the past, return what has been cached
         template = template_cache[path]
@@ -127,4 +130,6 @@ def to_yaml(template, path: str, **kwargs) -> None:
 
 def clear_cache():
     """Shorthand to clear template cache for whatever reason."""
+    from pyrates.frontend.fileio.yaml import file_cache
     template_cache.clear()
+    file_cache.clear()
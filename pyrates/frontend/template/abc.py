@@ -32,6 +32,8 @@
 __author__ = "Daniel Rose"
 __status__ = "Development"
 
+from sys import intern
+
 
 class AbstractBaseTemplate:
     """Abstract base class for templates"""
@@ -42,7 +44,7 @@ class AbstractBaseTemplate:
         """Basic initialiser for template classes, requires template name and path that it is loaded from. For custom
         templates that are not loaded from a file, the path can be set arbitrarily."""
         self.name = name
-        self.path = path
+        self.path = intern(path) if isinstance(path, str) else path
         self.__doc__ = description  # overwrite class-specific doc with user-defined description
 
     def __repr__(self):
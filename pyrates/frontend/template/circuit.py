@@ -36,7 +36,7 @@ arguments. For more detailed descriptions, see the respective docstrings.
 # external packages
 import gc
 from typing import List, Union, Dict, Optional, Tuple, Callable
-from copy import deepcopy
+from copy import copy, deepcopy
 from warnings import warn
 import pandas as pd
 from pandas import DataFrame, MultiIndex
@@ -280,7 +280,7 @@ class CircuitTemplate(AbstractBaseTemplate):
                 warn(PyRatesWarning(f'Variable {var} has not been found on operator {op} of node {node[0]}.'))
             n_nodes = len(target_nodes)
             for i, n in enumerate(target_nodes):
-                node_temp = deepcopy(self.get_node_template(n))
+                node_temp = copy(self.get_node_template(n))
                 val_tmp = val[i] if hasattr(val, 'shape') and sum(val.shape) == n_nodes else val
                 node_temp.update_var(op=op, var=var, val=val_tmp)
                 self.add_node_template(n, template=node_temp)
@@ -348,25 +348,25 @@ class CircuitTemplate(AbstractBaseTemplate):
             if hasattr(attr, 'shape') and len(attr.shape) >= 2:
                 matrix_attributes[key] = edge_attributes.pop(key)
 
+        # find all source-target pairs with a sufficiently strong connection (ordered by source node)
+        source_ids, target_ids = np.nonzero(np.abs(np.asarray(weight)).T > min_weight)
+
         # create edge list
         edges = []
-        for i, source in enumerate(source_nodes):
-            for j, target in enumerate(target_nodes):
-
-                if np.abs(weight[j, i]) > min_weight:
+        for i, j in zip(source_ids, target_ids):
 
-                    edge_attributes_tmp = {}
+            edge_attributes_tmp = {}
 
-                    # extract edge attribute value from matrices
-                    for key, attr in matrix_attributes.items():
-                        edge_attributes_tmp[key] = attr[j, i]
+            # extract edge attribute value from matrices
+            for key, attr in matrix_attributes.items():
+                edge_attributes_tmp[key] = attr[j, i]
 
-                    # add remaining attributes
-                    edge_attributes_tmp.update(edge_attributes.copy())
+            # add remaining attributes
+            edge_attributes_tmp.update(edge_attributes.copy())
 
-                    # add edge to list
-                    source_key, target_key = f"{source}/{source_var}", f"{target}/{target_var}"
-                    edges.append((source_key, target_key, template, edge_attributes_tmp))
+            # add edge to list
+            source_key, target_key = f"{source_nodes[i]}/{source_var}", f"{target_nodes[j]}/{target_var}"
+            edges.append((source_key, target_key, template, edge_attributes_tmp))
 
         # add edges to network
         self.update_template(edges=edges, in_place=True)
@@ -1262,7 +1262,8 @@ class CircuitTemplate(AbstractBaseTemplate):
         edge_col = {}
         for source, target, template, edge_dict, delayed in edges:
 
-            edge_dict = deepcopy(edge_dict)
+            # values are replaced (not modified in place) below, so a shallow copy of the edge attributes suffices
+            edge_dict = dict(edge_dict)
 
             # relabel variables according to variable map (accounting for vectorization)
             source_new = self._relabel_var(source, label_map)
@@ -66,6 +66,12 @@ class OperatorGraphTemplate(AbstractBaseTemplate):
                 self.operators[operator_template] = variations
                 self._op_map[operator_template.name] = operator_template
 
+    def __copy__(self):
+        """Creates a new template that shares the (immutable) operator templates with this template, but holds its own
+        copies of the operator variations, such that variable updates do not affect the original template."""
+        operators = {op: dict(variations) if variations else {} for op, variations in self.operators.items()}
+        return self.__class__(name=self.name, path=self.path, operators=operators, description=self.__doc__)
+
     def __getitem__(self, item):
         """Attempts to return the operator with name `item`.
         """
@@ -668,10 +668,9 @@ class NetworkGraph(AbstractBaseIR):
                 sidx_unique = np.unique(sidx)
                 tidx_unique = np.unique(tidx)
                 weight_mat = np.zeros((len(tidx_unique), len(sidx_unique)))
-                for t, s, w in zip(tidx, sidx, weight):
-                    row = np.argwhere(tidx_unique == t).squeeze()
-                    col = np.argwhere(sidx_unique == s).squeeze()
-                    weight_mat[row, col] = w
+                rows = np.searchsorted(tidx_unique, tidx)
+                cols = np.searchsorted(sidx_unique, sidx)
+                weight_mat[rows, cols] = weight
 
                 # define edge projection equation
                 s_str_final = _get_indexed_var_str(s_str, sidx_unique, ssize, idx_str=sidx_str, arg_dict=args)
@@ -683,7 +682,7 @@ class NetworkGraph(AbstractBaseIR):
             else:
 
                 # check wether weighting of source variables is required
-                if all([abs(w-1) < weight_minimum for w in weight]):
+                if np.all(np.abs(np.asarray(weight) - 1.0) < weight_minimum):
                     weighting = ""
                 else:
                     weighting = f" * {w_str}"
@@ -287,3 +287,104 @@ def test_1_7_equation_parsing():
             parse_equations(equations=[(eq, 'node/op')], equation_args=deepcopy(args), cg=cg, def_shape=())
             result = cg.eval_node(cg.var_updates[tvar[0]][tvar[1]])
             assert result == pytest.approx(target, rel=accuracy, abs=accuracy)
+
+
+def test_1_8_compute_node_copy():
+    """Tests whether compute graph nodes are copied correctly.
+
+    See Also
+    --------
+    :class:`ComputeVar`: Detailed documentation of compute graph variables.
+    """
+
+    from pyrates.backend.computegraph import ComputeVar
+    from sympy import Symbol
+
+    v = ComputeVar(name='a', symbol=Symbol('a'), vtype='constant', value=np.arange(3.0), dtype='float')
+    v_copy = deepcopy(v)
+
+    # copy should have the same type, attributes and value, but not share the value buffer
+    assert type(v_copy) is ComputeVar
+    assert v_copy.vtype == v.vtype
+    assert np.all(v_copy.value == v.value)
+    v_copy.value[0] = 10.0
+    assert v.value[0] == 0.0
+
+
+def test_1_9_multidimensional_state_vars():
+    """Tests whether multi-dimensional state variables are placed correctly in the state vector of the generated
+    right-hand side function.
+
+    See Also
+    --------
+    :method:`ComputeGraph.to_func`: Detailed documentation of the generation of the right-hand side function.
+    """
+
+    # define state variables of different dimensionality
+    a = np.arange(6.0).reshape(2, 3)
+    b = np.ones((2,))
+    args = {'node/op/a': {'vtype': 'state_var', 'value': a, 'shape': a.shape, 'dtype': a.dtype},
+            'node/op/b': {'vtype': 'state_var', 'value': b, 'shape': b.shape, 'dtype': b.dtype}}
+    equations = [("d/dt * a = 2.0*a", 'node/op'), ("d/dt * b = -b", 'node/op')]
+
+    for backend in backends:
+
+        # generate the right-hand side function
+        cg = ComputeGraph(backend=backend)
+        parse_equations(equations=equations, equation_args=deepcopy(args), cg=cg, def_shape=())
+        func, func_args, _, state_var_indices = cg.to_func('rhs_test', to_file=False)
+
+        # each state variable should occupy as many entries of the state vector as it has elements
+        assert state_var_indices == {'a': (0, 6), 'b': (6, 8)}
+        assert np.allclose(func_args[1], np.concatenate([a.flatten(), b]))
+        dy = func(*func_args)
+        assert np.allclose(dy, np.concatenate([2.0*a.flatten(), -b]))
+
+
+def test_1_10_subgraph_evaluation(monkeypatch):
+    """Tests the evaluation of compute graph nodes with shared inputs.
+
+    See Also
+    --------
+    :method:`ComputeGraph.eval_nodes`: Evaluation of multiple nodes with shared inputs.
+    :method:`ComputeGraph.eval_subgraph`: Evaluation of a node and removal of its inputs from the graph.
+    """
+
+    from sympy import Symbol
+
+    def diamond_graph(backend: str):
+        """Builds the graph o = (c + 1) * (c * 3), where both operations depend on the same constant c."""
+        cg = ComputeGraph(backend=backend)
+        calls = []
+
+        def add_one(x):
+            calls.append('l')
+            return x + 1.0
+
+        def mult_three(x):
+            calls.append('r')
+            return x * 3.0
+
+        c, _ = cg.add_var('c', value=2.0, vtype='constant', dtype='float', shape=())
+        l, _ = cg.add_op([c], label='l', expr=Symbol(c) + 1.0, func=add_one, dtype='float', shape=())
+        r, _ = cg.add_op([c], label='r', expr=Symbol(c) * 3.0, func=mult_three, dtype='float', shape=())
+        o, _ = cg.add_op([l, r], label='o', expr=Symbol(l) * Symbol(r), func=lambda x, y: x * y, dtype='float',
+                         shape=())
+        return cg, (c, l, r, o), calls
+
+    for backend in backends:
+
+        # shared inputs should only be evaluated once across all evaluated nodes
+        cg, (c, l, r, o), calls = diamond_graph(backend)
+        assert cg.eval_nodes([o, l]) == pytest.approx([18.0, 3.0], rel=accuracy, abs=accuracy)
+        assert sorted(calls) == ['l', 'r']
+
+        # sub-graph evaluation should store the result on the node and remove each of its inputs exactly once
+        cg, (c, l, r, o), _ = diamond_graph(backend)
+        removed = []
+        remove_nodes = cg.remove_nodes_from
+        monkeypatch.setattr(cg, 'remove_nodes_from', lambda nodes: (removed.extend(nodes), remove_nodes(nodes)))
+        assert cg.eval_subgraph(o) == pytest.approx(18.0, rel=accuracy, abs=accuracy)
+        assert sorted(removed) == sorted([c, l, r])
+        assert list(cg.nodes) == [o]
+        assert cg.get_var(o).value == pytest.approx(18.0, rel=accuracy, abs=accuracy)
@@ -89,13 +89,16 @@ def test_full_jansen_rit_circuit_template_load():
              "ein": "model_templates.neural_mass_models.jansenrit.IN",
              "iin": "model_templates.neural_mass_models.jansenrit.IN"}
 
+    cached_paths = set(template_cache)
+    assert set(nodes.values()) <= cached_paths
     for key, value in nodes.items():
         assert isinstance(template.nodes[key], NodeTemplate)
         assert template.nodes[key] is template_cache[value]
-        # test operators in node templates
-        for op in template.nodes[key].operators:
-            assert op.path in template_cache
-            assert isinstance(op, OperatorTemplate)
+
+    # test operators in node templates
+    ops = {op for key in nodes for op in template.nodes[key].operators}
+    assert all(isinstance(op, OperatorTemplate) for op in ops)
+    assert {op.path for op in ops} <= cached_paths
 
     # test that all item views work correctly
     for key, value in nodes.items():
@@ -104,6 +107,32 @@ def test_full_jansen_rit_circuit_template_load():
         assert "input" in template[key]["pro"]["v"]
 
 
+def test_yaml_file_cache():
+    """Test that YAML files containing multiple templates are only parsed once."""
+
+    from pyrates.frontend.template.circuit import CircuitTemplate
+    from pyrates.frontend.template import clear_cache
+    from pyrates.frontend.fileio.yaml import file_cache, dict_from_yaml
+    clear_cache()
+
+    CircuitTemplate.from_yaml("model_templates.neural_mass_models.jansenrit.JRC")
+    jrc_files = [f for f in file_cache if "jansenrit" in f]
+    assert len(jrc_files) == 1
+
+    # cached files are identified by absolute paths, such that changes of the working directory are safe
+    from os.path import isabs
+    assert all(isabs(f) for f in file_cache)
+
+    # templates returned from the cache must not share state with the cached file content
+    t1 = dict_from_yaml("model_templates.neural_mass_models.jansenrit.PC")
+    t1.pop("base")
+    t2 = dict_from_yaml("model_templates.neural_mass_models.jansenrit.PC")
+    assert "base" in t2
+
+    clear_cache()
+    assert not file_cache
+
+
 def test_edge_definition_via_matrix():
     """Test, if CircuitTemplate.add_edges_from_matrix works as expected."""
 
@@ -158,6 +187,23 @@ def test_circuit_instantiation():
     assert type(ir._front_to_back['pc/pro/m']) is ComputeVar
 
 
+def test_circuit_variable_update():
+    """Test, if variable updates on a circuit do not alter the cached node templates."""
+    path = "model_templates.neural_mass_models.jansenrit.JRC"
+    from pyrates import clear_frontend_caches, CircuitTemplate
+    clear_frontend_caches()
+
+    circuit = CircuitTemplate.from_yaml(path)
+    pc_orig = circuit.get_node_template('pc')
+    circuit = CircuitTemplate.from_yaml(path).update_var(node_vars={'pc/rpo_e_in/h': 4.0})
+    pc_new = circuit.get_node_template('pc')
+
+    assert pc_new is not pc_orig
+    assert pc_new.operators[pc_new.get_op('rpo_e_in')]['h'] == 4.0
+    assert 'h' not in pc_orig.operators[pc_orig.get_op('rpo_e_in')]
+    assert pc_new.get_op('rpo_e_in') is pc_orig.get_op('rpo_e_in')
+
+
 def test_multi_circuit_instantiation():
     """Test, if a circuit with subcircuits is also working."""
     path = "model_templates.neural_mass_models.jansenrit.JRC_2delaycoupled"
@@ -229,4 +275,4 @@ def test_python_interface():
                       outputs={'r': 'p/qif_op/r'}, inputs={'p/qif_op/I_ext': inp})
     clear(qif_yaml)
 
-    assert np.mean(r1.values - r2.values) == pytest.approx(0.0, rel=1e-4, abs=1e-4)
+    assert abs(np.mean(r1.values - r2.values)) <= 1e-4